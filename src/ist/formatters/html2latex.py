@@ -3,178 +3,255 @@
 # author:   Jan Hybs
 
 from __future__ import absolute_import
-import xml.etree.ElementTree as ET
 
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.cElementTree as ET
 
-class Html2Latex(object):
-    """
-    Class Html2Latex which based on given element (html/string) can produce latex format
-    """
 
-    list_types = {
-        'ul': 'itemize',
-        'ol': 'enumerate'
-    }
+LIST_TYPES = {
+    'ul': 'itemize',
+    'ol': 'enumerate'
+}
 
-    def __init__(self, element):
-        if type(element) in (str, unicode):
-            tree = ET.fromstring('<html_example>' + element + "</html_example>")
-            self.el = tree
+
+def _exit_tail(el, tail, parts):
+    """ Adds element tail if exists """
+    if tail:
+        if tail == '\n':
+            parts.append(tail)
         else:
-            self.el = element
+            parts.append('{')
+            parts.append(tail)
+            parts.append('}')
+
+
+def _is_alink(el):
+    """ whether given element is Alink href """
+    return el.attrib.get('data-href') == 'Alink'
+
+
+# every tag has pair of handlers (enter, exit)
+# enter handler gets element text, adds opening part and text and returns
+# True if children should be processed, exit handler gets element tail
+# and adds closing part and tail
+
+
+def _enter_p(el, text, parts):
+    parts.append('{')
+    parts.append('{')
+    parts.append(text)
+    parts.append('}')
+    return True
+
+
+def _exit_p(el, tail, parts):
+    _exit_tail(el, tail, parts)
+    parts.append('}')
+
+
+def _enter_br(el, text, parts):
+    parts.append(text)
+    parts.append(r'\\')
+    return True
 
+
+def _enter_h1(el, text, parts):
+    parts.append('\\section')
+    parts.append('{')
+    parts.append(text)
+    return True
+
+
+def _enter_a(el, text, parts):
+    # Alink href?
+    if _is_alink(el):
+        url = el.attrib.get('href')
+        if url.startswith('#'):
+            url = url[1:]
+        # TexList imports this module
         from ist.utils.texlist2 import TexList
+        parts.append('\\Alink{%s}{%s}' % (
+            TexList.name_mode(url), TexList.plain_mode(str(el.attrib.get('text')))))
+        return False
+
+    # other href
+    parts.append('\\href')
+    parts.append('{' + str(el.attrib.get('href')) + '}')
+    parts.append('{')
+    parts.append('{' + str(text) + '}')
+    return True
+
+
+def _exit_a(el, tail, parts):
+    if not _is_alink(el):
+        parts.append('}')
+    _exit_tail(el, tail, parts)
+
+
+def _enter_em(el, text, parts):
+    parts.append('\\textit')
+    parts.append('{')
+    parts.append(text)
+    return True
+
+
+def _enter_strong(el, text, parts):
+    parts.append('\\textbf')
+    parts.append('{')
+    parts.append(text)
+    return True
+
+
+def _exit_braced(el, tail, parts):
+    parts.append('}')
+    _exit_tail(el, tail, parts)
+
 
-        self.tex = TexList()
-
-    def extend_children(self):
-        """
-        Recursive children call
-        """
-        for child in self.el:
-            self.tex.extend(Html2Latex(child).to_latex())
-
-    def tag_is(self, *tags):
-        """
-        whether current tag is in given tags
-        """
-        return self.el.tag in tags
-
-    def text(self):
-        """ return current text """
-        return self.el.text if self.el.text else ''
-
-    def tail(self):
-        """ return current tail """
-        return self.el.tail if self.el.tail else ''
-
-    def add_text(self):
-        if str(self.text).strip():
-            with self.tex:
-                self.tex.append(self.text())
-
-    def add_tail(self):
-        """
-        Adds current tail if exists
-        """
-        if self.tail():
-            if self.tail() == '\n':
-                self.tex.append(self.tail())
-            else:
-                with self.tex:
-                    self.tex.append(self.tail())
-
-    def get_list_type(self):
-        """ helper method for getting list type"""
-        return self.list_types.get(self.el.tag, 'itemize')
-
-    #
-    # def tag (self):
-    # return self.el.tag
-
-    def to_latex(self):
-        """
-        Method converts this object to latex with recursive calls
-        """
-
-        if self.tag_is('p'):
-            with self.tex:
-                with self.tex:
-                    self.tex.append(self.text())
-                self.extend_children()
-                self.add_tail()
-                # self.tex.newline ()
-
-        elif self.tag_is('br'):
-            self.tex.append(self.text())
-            self.tex.append(r'\\')
-            self.extend_children()
-            self.add_tail()
-
-        elif self.tag_is('h1'):
-            self.tex.append('\\section')
-            with self.tex:
-                self.tex.append(self.text())
-                self.extend_children()
-            self.add_tail()
-
-        elif self.tag_is('a'):
-            self.tex.extend(LatexHref(self.el).to_latex())
-
-        elif self.tag_is('em'):
-            self.tex.append('\\textit')
-            with self.tex:
-                self.tex.append(self.text())
-                self.extend_children()
-            self.add_tail()
-
-        elif self.tag_is('strong'):
-            self.tex.append('\\textbf')
-            with self.tex:
-                self.tex.append(self.text())
-                self.extend_children()
-            self.add_tail()
-
-        elif self.tag_is('ul', 'ol'):
-            self.tex.begin(self.get_list_type())
-            self.tex.append(self.text().strip())
-            self.extend_children()
-            self.tex.end(self.get_list_type())
-            self.add_tail()
-
-        elif self.tag_is('li'):
-            # with self.tex:
-            self.tex.append('\\item ')
-            self.add_text()
-            self.extend_children()
-            self.add_tail()
-
-        # so far, code tag will be monospaced only
-        elif self.tag_is('code'):
-            # self.tex.open_element ('lstlisting')
-            # self.tex.newline ()
-            self.tex.slash('ttfamily ')
-            self.tex.append(self.text().replace('\$', '\$'))
-            # self.extend_children ()
-            # self.tex.newline ()
-            # self.tex.close_element ('lstlisting')
-            # self.add_tail ()
-
-        elif self.tag_is('span'):
-            self.tex.append(self.text())
-            self.extend_children()
-            self.add_tail()
+def _newline(parts, force=False):
+    # TexList imports this module
+    from ist.utils.texlist2 import TexList
+    if TexList.PRETTY_FORMAT and (force or not parts or parts[-1] != '\n'):
+        parts.append('\n')
 
+
+def _enter_list(el, text, parts):
+    # list starts its own part of output, so newline
+    # is added before begin even if previous token is newline
+    _newline(parts, force=True)
+    parts.append('\\begin')
+    parts.append('{' + LIST_TYPES.get(el.tag, 'itemize') + '}')
+    _newline(parts)
+    parts.append(text.strip())
+    return True
+
+
+def _exit_list(el, tail, parts):
+    _newline(parts)
+    parts.append('\\end')
+    parts.append('{' + LIST_TYPES.get(el.tag, 'itemize') + '}')
+    _newline(parts)
+    _exit_tail(el, tail, parts)
+
+
+def _enter_li(el, text, parts):
+    parts.append('\\item ')
+    parts.append('{')
+    parts.append(text)
+    parts.append('}')
+    return True
+
+
+# so far, code tag will be monospaced only
+# children and tail are ignored
+def _enter_code(el, text, parts):
+    parts.append('\\ttfamily ')
+    parts.append(text.replace('\$', '\$'))
+    return False
+
+
+def _exit_code(el, tail, parts):
+    pass
+
+
+def _enter_span(el, text, parts):
+    parts.append(text)
+    return True
+
+
+def _enter_default(el, text, parts):
+    parts.append('{')
+    parts.append(text)
+    return True
+
+
+_HANDLERS = {
+    'p': (_enter_p, _exit_p),
+    'br': (_enter_br, _exit_tail),
+    'h1': (_enter_h1, _exit_braced),
+    'a': (_enter_a, _exit_a),
+    'em': (_enter_em, _exit_braced),
+    'strong': (_enter_strong, _exit_braced),
+    'ul': (_enter_list, _exit_list),
+    'ol': (_enter_list, _exit_list),
+    'li': (_enter_li, _exit_tail),
+    'code': (_enter_code, _exit_code),
+    'span': (_enter_span, _exit_tail),
+}
+_DEFAULT_HANDLER = (_enter_default, _exit_p)
+
+
+def _children(el):
+    """
+    Returns element text and list of (child, tail) pairs
+    Comments and processing instructions (kept in tree by lxml) are skipped,
+    their tails are merged to previous text as they would not exist at all
+    :rtype: (str, list)
+    """
+    text = el.text or ''
+    children = []
+    for child in el:
+        if isinstance(child.tag, basestring):
+            children.append((child, child.tail or ''))
+        elif children:
+            children[-1] = children[-1][0], children[-1][1] + (child.tail or '')
         else:
-            with self.tex:
-                self.tex.append(self.text())
-                self.extend_children()
-                self.add_tail()
+            text += child.tail or ''
+    return text, children
 
-        return self.tex
 
+# traversal phases
+_ENTER = 0
+_EXIT = 1
 
-class LatexHref(Html2Latex):
+
+def _walk(root, parts):
+    """
+    Converts element tree to latex tokens stored in parts
+    Tree is traversed iteratively using explicit stack, every element
+    is visited twice, on enter opening part and text is added, on exit
+    closing part and tail is added
+    :rtype: list[str]
+    """
+    # bind lookups to locals, loop runs for every element
+    get_handlers = _HANDLERS.get
+    default = _DEFAULT_HANDLER
+    stack = [(root, _ENTER, root.tail or '')]
+    push = stack.append
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        el, phase, tail = pop()
+        on_enter, on_exit = get_handlers(el.tag, default)
+        if phase == _EXIT:
+            on_exit(el, tail, parts)
+            continue
+
+        push((el, _EXIT, tail))
+        text, children = _children(el)
+        if on_enter(el, text, parts):
+            extend([(child, _ENTER, child_tail) for child, child_tail in reversed(children)])
+
+    return parts
+
+
+def html_to_parts(element):
     """
-    Class for latex hrefs
+    Converts given element (html/string) to list of latex tokens
+    :rtype: list[str]
     """
+    if type(element) in (str, unicode):
+        # cElementTree cannot parse non-ascii unicode
+        if type(element) is unicode:
+            element = element.encode('utf-8')
+        element = ET.fromstring('<html_example>' + element + '</html_example>')
+    return _walk(element, list())
 
-    def to_latex(self):
 
-        # Alink href?
-        if self.el.attrib.get('data-href') == 'Alink':
-            url = self.el.attrib.get('href')
-            if url.startswith('#'):
-                url = url[1:]
-            text = self.el.attrib.get('text')
-            self.tex.macro_alink_(url=url, text=text)
-            self.add_tail()
-        else:
-            # other href
-            self.tex.append('\\href')
-            self.tex.add(self.el.attrib.get('href'))
-            with self.tex:
-                self.tex.add(self.text())
-                self.extend_children()
-            self.add_tail()
-        return self.tex
+def html_to_latex(element):
+    """
+    Converts given element (html/string) to latex
+    :rtype: str
+    """
+    return ''.join(html_to_parts(element))
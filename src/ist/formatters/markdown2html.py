@@ -16,8 +16,37 @@ class markdown2html(object):
     Class markdown2html is simple helper class for parsing md to html
     """
 
+    extensions = [
+        'markdown.extensions.sane_lists',
+        'markdown.extensions.nl2br',
+        'ist.formatters.extensions.md_links',
+        'ist.formatters.extensions.md_strike']
+
     def __init__(self):
         self._md_latex = ExpressionPlaceholder()
+        self._md = None
+
+    def _markdown(self, md_text):
+        """
+        Converts markdown to html, Markdown instance (with all extensions
+        loaded) is created only once and reset before every conversion
+        :type md_text: str
+        """
+        if self._md is None:
+            self._md = markdown.Markdown(extensions=self.extensions)
+        return self._md.reset().convert(md_text)
+
+    @staticmethod
+    def _to_tree(html, reduce_tag):
+        """
+        Parses html to element tree, html is wrapped in reduce_tag,
+        wrapper is omitted when html contains single root element
+        """
+        root = ET.fromstring('<' + reduce_tag + '>' + html + '</' + reduce_tag + '>')
+        if len(root) == 1 and not (root.text or '').strip() and not (root[0].tail or '').strip():
+            root = root[0]
+            root.tail = None
+        return root
 
     def _replace_math(self, md_text):
         """
@@ -41,36 +70,22 @@ class markdown2html(object):
         latex_secured = TexList.prepare_plain(secured_markdown)
 
         # apply markdown
-        html_secured = markdown.markdown(latex_secured, extensions=[
-            'markdown.extensions.sane_lists',
-            'markdown.extensions.nl2br',
-            'ist.formatters.extensions.md_links',
-            'ist.formatters.extensions.md_strike'])
+        html_secured = self._markdown(latex_secured)
         html_secured = TexList.finish_plain(html_secured)
         html = self._md_latex.finish(html_secured)
 
-        try:
-            return ET.fromstring(html)
-        except Exception as e:
-            return ET.fromstring('<' + reduce_tag + '>' + html + '</' + reduce_tag + '>')
+        return self._to_tree(html, reduce_tag)
 
     def parse(self, md_text, reduce_to_tree=False, reduce_tag='div'):
         secured_markdown = self._md_latex.prepare(md_text)
         secured_markdown = cgi.escape(secured_markdown)
 
-        html_secured = markdown.markdown(secured_markdown, extensions=[
-            'markdown.extensions.sane_lists',
-            'markdown.extensions.nl2br',
-            'ist.formatters.extensions.md_links',
-            'ist.formatters.extensions.md_strike'])
+        html_secured = self._markdown(secured_markdown)
         html = self._md_latex.finish(html_secured)
 
         if not reduce_to_tree:
             return html
-        try:
-            return ET.fromstring(html)
-        except Exception as e:
-            return ET.fromstring('<' + reduce_tag + '>' + html + '</' + reduce_tag + '>')
+        return self._to_tree(html, reduce_tag)
 
 
 class ExpressionPlaceholder(object):
@@ -12,6 +12,9 @@ class Globals(object):
     :type items             : dict[ist.base.Parsable]
     """
     items = {}
+    # incremented every time items change, results depending
+    # on registered items can be cached by this value
+    version = 0
     names = {
         'record': 'type_name',
         'r': 'type_name',
@@ -67,6 +70,7 @@ class Globals(object):
 
     @staticmethod
     def save(key, item):
+        Globals.version += 1
         if key in Globals.items:
             Logger.instance().info('duplicate key %s' % key)
             for i in range(2, 100):
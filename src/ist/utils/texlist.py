@@ -5,7 +5,7 @@
 from __future__ import absolute_import
 import re
 from ist.base import Unicode
-from ist.formatters.html2latex import Html2Latex
+from ist.formatters.html2latex import html_to_parts
 from ist.formatters.markdown2html import markdown2html
 
 
@@ -239,8 +239,7 @@ class texlist(list):
         """
         # return self.escape (value.strip ().replace ('\n', '\\\\'))
         html = self.m2h.parse(str(value), True)
-        latex = Html2Latex(html)
-        result = latex.to_latex()
+        result = html_to_parts(html)
         desc_result = list()
         for r in result:
             if r.startswith('{$') and r.endswith('$}'):
@@ -2,8 +2,10 @@
 # -*- coding: utf-8 -*-
 # author:   Jan Hybs
 import re
-from ist.formatters.html2latex import Html2Latex
+from ist.formatters.html2latex import html_to_latex
 from ist.formatters.markdown2html import markdown2html
+from ist.globals import Globals
+from utils.cache import LRUCache
 
 
 class TexList(list):
@@ -27,6 +29,8 @@ class TexList(list):
         [r'<-', r'{\leftarrow}'],
     ]
     m2h = markdown2html()
+    """Cache for converted descriptions, same descriptions repeat a lot"""
+    description_cache = LRUCache(1024)
     _OPEN = '{'
     _CLOSE = '}'
     _SLASH = '\\'
@@ -209,10 +213,14 @@ class TexList(list):
         if not value.strip():
             return ''
 
-        html = TexList.m2h.parse2latex(str(value))
-        latex = Html2Latex(html)
-        result = latex.to_latex()
-        return ''.join(result)
+        # links in description are resolved using Globals
+        # so result depends on registered items as well
+        key = (value, cls.PRETTY_FORMAT, Globals.version)
+        result = cls.description_cache.get(key)
+        if result is None:
+            html = TexList.m2h.parse2latex(str(value))
+            result = cls.description_cache.put(key, html_to_latex(html))
+        return result
 
     @classmethod
     def equation_mode(cls, value):
@@ -65,11 +65,12 @@ class ArtifactProcessor(object):
         Printer.all.sep()
         Printer.all.out("Collecting artifacts...")
         Printer.all.sep()
-        counter = ProgressCounter('Artifact step {:02d} / {total:02d}: {step}')
         total = len(self.steps)
+        counter = ProgressCounter(
+            lambda i, step: 'Artifact step {:02d} / {:02d}: {}'.format(i, total, step))
         with Printer.all.with_level(1):
             for step in self.steps:
-                counter.next(locals())
+                counter.next(step)
                 with Printer.all.with_level(1):
                     step.run()
         Printer.all.sep()
@@ -665,6 +665,12 @@ class DynamicSleep(object):
 
         return self.steps[self.current]
 
+    def reset(self):
+        """
+        Start again from the shortest sleep duration
+        """
+        self.current = -1
+
 
 class TestPrinterStatus(object):
     template = '{status_name:11s} | {case_name:45s} [{thread.duration:5.2f} sec] {detail}'
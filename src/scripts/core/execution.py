@@ -6,6 +6,7 @@ import os
 import subprocess
 import sys
 import tempfile
+import weakref
 # ----------------------------------------------
 from scripts import psutils
 from scripts.core.base import IO, Paths, Command
@@ -28,11 +29,14 @@ class OutputMode(object):
         self.content = None
 
     def open(self):
-        if self.mode is self.DUMMY:
-            return subprocess.PIPE
+        # output is never read, nobody would empty pipe so process could
+        # block once pipe buffer is full, send output to devnull instead
+        if self.mode in {self.DUMMY, self.HIDE}:
+            self.fp = open(os.devnull, 'w')
+            return self.fp
 
-        if self.mode in {self.SHOW, self.HIDE}:
-            return {self.SHOW: None, self.HIDE: subprocess.PIPE}.get(self.mode)
+        if self.mode is self.SHOW:
+            return None
 
         if self.mode in {self.WRITE, self.APPEND, self.VARIABLE}:
 
@@ -47,10 +51,7 @@ class OutputMode(object):
             return self.fp
 
     def close(self):
-        if self.mode is self.DUMMY:
-            return
-
-        if self.mode in {self.WRITE, self.APPEND, self.VARIABLE}:
+        if self.mode in {self.WRITE, self.APPEND, self.VARIABLE, self.DUMMY, self.HIDE}:
             if self.fp is not None:
                 if type(self.fp) is int:
                     os.close(self.fp)
@@ -106,10 +107,11 @@ class BinExecutor(ExtendedThread):
     """
     Class which executes command and saves returncode
     :type process: scripts.psutils.Process
-    :type threads: list[scripts.core.execution.BinExecutor]
+    :type threads: weakref.WeakSet[scripts.core.execution.BinExecutor]
     :type output : OutputMode
     """
-    threads = list()
+    # only live executors are kept, finished ones can be garbage collected
+    threads = weakref.WeakSet()
     stopped = False
 
     @staticmethod
@@ -126,7 +128,7 @@ class BinExecutor(ExtendedThread):
         else:
             sys.stderr.write("\nError: Terminating application threads\n")
         # try to kill all running processes
-        for executor in BinExecutor.threads:
+        for executor in list(BinExecutor.threads):
             try:
                 if executor.process.is_running():
                     sys.stderr.write('\nTerminating process {}...\n'.format(executor.process.pid))
@@ -137,7 +139,7 @@ class BinExecutor(ExtendedThread):
 
     def __init__(self, command, name='exec-thread'):
         super(BinExecutor, self).__init__(name)
-        BinExecutor.threads.append(self)
+        BinExecutor.threads.add(self)
         self.command = [str(x) for x in ensure_iterable(command)]
         self.process = None
         self.broken = False
@@ -3,7 +3,6 @@
 # author:   Jan Hybs
 # ----------------------------------------------
 import json
-import math
 import time
 import threading
 
@@ -44,6 +43,9 @@ class ExtendedThread(threading.Thread):
         self.on_start = Event()
         self.on_complete = Event()
         self.on_update = Event()
+        # callbacks called once thread finishes, unlike on_complete
+        # handlers these are called even if some handler raises
+        self.on_finished = list()
 
     def _run(self):
         if self.target:
@@ -73,12 +75,19 @@ class ExtendedThread(threading.Thread):
 
     def run(self):
         self.state = ProcessState.STARTED
-        self.on_start(self)
-        self.start_time = time.time()
-        self._run()
-        self.end_time = time.time()
-        self.on_complete(self)
-        self.state = ProcessState.FINISHED
+        try:
+            self.on_start(self)
+            self.start_time = time.time()
+            self._run()
+        finally:
+            # always propagate on_complete event, someone may wait for it
+            self.end_time = time.time()
+            try:
+                self.on_complete(self)
+            finally:
+                self.state = ProcessState.FINISHED
+                for callback in self.on_finished:
+                    callback(self)
 
     def is_over(self):
         return self.state == ProcessState.FINISHED
@@ -138,8 +147,10 @@ class MultiThreads(ExtendedThread):
     def __init__(self, name, progress=False):
         super(MultiThreads, self).__init__(name)
         self.threads = list()
-        self.returncodes = dict()
         self.running = 0
+        self.completed = 0
+        # notified each time some thread completes
+        self._cv = threading.Condition()
         self.stop_on_error = False
         self.counter = None
         self.progress = progress
@@ -159,21 +170,22 @@ class MultiThreads(ExtendedThread):
         if self.counter:
             if self.separate:
                 Printer.all.sep()
-            self.counter.next(locals())
+            self.counter.next(self.threads[self.index - 1])
 
-        self.threads[self.index - 1].start()
+        thread = self.threads[self.index - 1]
+        self.on_thread_start(thread)
+        thread.start()
         return True
 
     def add(self, thread):
         """
         :type thread: scripts.core.threads.ExtendedThread
         """
+        # runner waits until every started thread is finished, completion
+        # is not subscribed as on_complete handler since other handler
+        # may raise before
+        thread.on_finished.append(self.on_thread_complete)
         self.threads.append(thread)
-        self.returncodes[thread] = None
-        try:
-            thread.on_start += self.on_thread_start
-            thread.on_complete += self.on_thread_complete
-        except: pass
 
     @property
     def current_thread(self):
@@ -181,7 +193,8 @@ class MultiThreads(ExtendedThread):
 
     @property
     def returncode(self):
-        return max(self.returncodes.values()) if self.returncodes else 0
+        # highest returncode of finished threads, updated in on_thread_complete
+        return self._returncode if self.threads else 0
 
     @property
     def total(self):
@@ -191,11 +204,15 @@ class MultiThreads(ExtendedThread):
         """
         :type thread: scripts.core.threads.ExtendedThread
         """
-        self.running += 1
+        with self._cv:
+            self.running += 1
 
     def on_thread_complete(self, thread):
-        self.returncodes[thread] = thread.returncode
-        self.running -= 1
+        with self._cv:
+            self._returncode = max(self._returncode, thread.returncode)
+            self.running -= 1
+            self.completed += 1
+            self._cv.notify_all()
 
     # aliases
     __len__ = total
@@ -215,10 +232,13 @@ class SequentialThreads(MultiThreads):
 
     def _run(self):
         if self.progress:
+            name, total = self.name, self.total
             if self.thread_name_property:
-                self.counter = ProgressCounter('{self.name}: {:02d} of {self.total:02d} | {self.current_thread.name}')
+                self.counter = ProgressCounter(
+                    lambda i, thread: '{}: {:02d} of {:02d} | {}'.format(name, i, total, thread.name))
             else:
-                self.counter = ProgressCounter('{self.name}: {:02d} of {self.total:02d}')
+                self.counter = ProgressCounter(
+                    lambda i, thread: '{}: {:02d} of {:02d}'.format(name, i, total))
 
         with Printer.all.with_level(1 if self.indent else 0):
             while True:
@@ -250,7 +270,9 @@ class ParallelThreads(MultiThreads):
     def __init__(self, n=4, name='runner', progress=True):
         super(ParallelThreads, self).__init__(name, progress)
         self.n = n if type(n) is int else 1
-        self.counter = ProgressCounter('Case {:02d} of {self.total:02d}')
+        # threads are added later, total is read when printing
+        self.counter = ProgressCounter(
+            lambda i, thread: 'Case {:02d} of {:02d}'.format(i, self.total))
         self.stop_on_error = True
         self.separate = True
 
@@ -265,23 +287,21 @@ class ParallelThreads(MultiThreads):
         return True
 
     def _run(self):
-        # determine how many parallel batches will be
-        # later on take cpu into account
-        steps = int(math.ceil(float(self.total) / self.n))
-
-        # run each batched
-        for i in range(steps):
-            batch = [x for x in range(i * self.n, i * self.n + self.n) if x < len(self.threads)]
-            for t in batch:
-                self.run_next()
-
-            for t in batch:
-                self.threads[t].join()
-
-            if self.stop_on_error and self.returncode > 0:
-                self.stopped = True
-                # no need to stop processes, just break
-                break
+        # keep n threads running, start next thread as soon as
+        # some thread completes
+        with self._cv:
+            while True:
+                if self.stop_on_error and self.returncode > 0:
+                    # no need to stop processes, just do not start new ones
+                    self.stopped = True
+
+                # threads which were started but did not complete yet
+                if self.index - self.completed < self.n and self.run_next():
+                    continue
+
+                if self.index == self.completed:
+                    break
+                self._cv.wait()
 
     def dump(self):
         return ResultParallelThreads(self)
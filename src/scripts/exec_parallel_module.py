@@ -79,9 +79,13 @@ class ModuleExecParallel(ScriptModule):
         :type pbs_module: scripts.pbs.modules.pbs_tarkil_cesnet_cz
         :rtype: list[(str, PBSModule)]
         """
+        import pkgutil
 
         jobs = list()
 
+        # same script is used for every job
+        script = pkgutil.get_loader('exec_parallel').filename
+
         for p in self.proc:
             case = ConfigCase(dict(
                 proc=p,
@@ -94,7 +98,7 @@ class ModuleExecParallel(ScriptModule):
             pbs_run.queue = self.arg_options.get('queue', True)
             pbs_run.ppn = self.arg_options.get('ppn', 1)
 
-            pbs_content = self.create_pbs_job_content(pbs_module, case)
+            pbs_content = self.create_pbs_job_content(pbs_module, case, script)
             IO.write(case.fs.pbs_script, pbs_content)
 
             qsub_command = pbs_run.get_pbs_command(case.fs.pbs_script)
@@ -120,9 +124,10 @@ class ModuleExecParallel(ScriptModule):
             result.add(pypy)
         else:
             # optionally we use counter
-            progress = ProgressCounter('Running {:02d} of {total:02d}')
+            progress = ProgressCounter(
+                lambda i: 'Running {:02d} of {:02d}'.format(i, total))
             for p in self.proc:
-                progress.next(locals())
+                progress.next()
                 Printer.all.sep()
 
                 with Printer.all.with_level():
@@ -132,20 +137,20 @@ class ModuleExecParallel(ScriptModule):
 
         return result.singlify()
 
-    def create_pbs_job_content(self, module, case):
+    def create_pbs_job_content(self, module, case, script):
         """
         :type case: scripts.config.yaml_config.ConfigCase
         :type module: scripts.pbs.modules.pbs_tarkil_cesnet_cz
+        :type script: str
+        :param script: path to the script which will be executed in job
         :rtype : str
         """
 
-        import pkgutil
-
         command = strings.replace_placeholders(
             exec_parallel_command,
 
             python=sys.executable,
-            script=pkgutil.get_loader('exec_parallel').filename,
+            script=script,
             limits="-n {case.proc} -m {case.memory_limit} -t {case.time_limit}".format(case=case),
             args="" if not self.arg_options.rest else Command.to_string(self.arg_options.rest),
             dump_output=case.fs.dump_output,
@@ -9,6 +9,7 @@ import platform
 import yaml
 
 from scripts.core.base import Paths, Printer
+from utils.cache import LRUCache
 # ----------------------------------------------
 
 
@@ -36,7 +37,51 @@ class DummyModule(object):
         pass
 
 
+# loaded pbs modules for each hostname_hint
+_pbs_modules = LRUCache(8)
+
+# parsed host_table.yaml and node name of this machine
+_host_table_cache = None
+_node_cache = None
+
+
+def get_host_table(host_file):
+    """
+    Returns parsed content of given host_table.yaml file,
+    file is parsed only once
+    :rtype : dict
+    """
+    global _host_table_cache
+    if _host_table_cache is None:
+        with open(host_file, 'r') as fp:
+            _host_table_cache = yaml.load(fp) or dict()
+    return _host_table_cache
+
+
+def get_node():
+    """
+    Returns network name of this machine, value is looked up only once
+    :rtype : str
+    """
+    global _node_cache
+    if _node_cache is None:
+        _node_cache = platform.node()
+    return _node_cache
+
+
 def get_pbs_module(hostname_hint=None):
+    """
+    Returns pbs module for given hostname_hint (see find_pbs_module),
+    module is looked up only once for each hostname_hint
+    :rtype : scripts.pbs.modules.pbs_tarkil_cesnet_cz
+    """
+    pbs_module = _pbs_modules.get(hostname_hint)
+    if pbs_module is None:
+        pbs_module = _pbs_modules.put(hostname_hint, find_pbs_module(hostname_hint))
+    return pbs_module
+
+
+def find_pbs_module(hostname_hint=None):
     """
     file host_table.yaml serves as lookup table when using python script in queue mode
     each key is hostname and each value names a module which should be loaded
@@ -51,15 +96,14 @@ def get_pbs_module(hostname_hint=None):
     pbs_module_path = None
     host_file = Paths.join(Paths.flow123d_root(), 'config', 'host_table.yaml')
     host_file_exists = Paths.exists(host_file)
-    hostname = hostname_hint or platform.node()
+    hostname = hostname_hint or get_node()
     from_host = False
 
     # try to get name from json file
     if host_file_exists:
-        with open(host_file, 'r') as fp:
-            hosts = yaml.load(fp)
-            pbs_module_path = hosts.get(hostname, None)
-            from_host = pbs_module_path is not None
+        hosts = get_host_table(host_file)
+        pbs_module_path = hosts.get(hostname, None)
+        from_host = pbs_module_path is not None
 
     if not pbs_module_path:
         hostname = hostname.replace('.', '_')
@@ -3,6 +3,7 @@
 # author:   Jan Hybs
 # ----------------------------------------------
 import subprocess
+from multiprocessing.pool import ThreadPool
 # ----------------------------------------------
 from scripts.core.base import Printer, DynamicSleep
 from scripts.core.threads import ResultHolder
@@ -10,24 +11,61 @@ from scripts.pbs.job import MultiJob, JobState
 # ----------------------------------------------
 
 
-def insert_jobs(jobs, pbs_module):
+def _qsub(qsub_command):
+    """
+    Submits single job, returns tuple (output, None) on success
+    or (None, exception) when command fails
+    """
+    try:
+        return subprocess.check_output(qsub_command), None
+    except Exception as e:
+        return None, e
+
+
+def insert_jobs(jobs, pbs_module, workers=16):
     # start jobs
     total = len(jobs)
     Printer.all.out('Starting {} job/s', total)
 
     job_id = 0
     multijob = MultiJob(pbs_module.ModuleJob)
-    with Printer.all.with_level():
-        for qsub_command, pbs_run in jobs:
-            job_id += 1
-
-            Printer.console.dyn('Starting jobs {:02d} of {:02d}', job_id, total)
-            Printer.batched.out('Starting jobs {:02d} of {:02d}', job_id, total)
-
-            output = subprocess.check_output(qsub_command)
-            job = pbs_module.ModuleJob.create(output, pbs_run.case)
-            job.full_name = "Case {}".format(pbs_run.case)
-            multijob.add(job)
+    error = None
+
+    # qsub calls are submitted concurrently, results are
+    # processed in original order, all results are read even if
+    # some qsub fails since other jobs may be already in queue
+    pool = ThreadPool(max(1, min(workers, total)))
+    try:
+        outputs = pool.imap(_qsub, [qsub_command for qsub_command, pbs_run in jobs])
+        with Printer.all.with_level():
+            for output, exception in outputs:
+                qsub_command, pbs_run = jobs[job_id]
+                job_id += 1
+
+                Printer.console.dyn('Starting jobs {:02d} of {:02d}', job_id, total)
+                Printer.batched.out('Starting jobs {:02d} of {:02d}', job_id, total)
+
+                try:
+                    if exception is not None:
+                        raise exception
+                    job = pbs_module.ModuleJob.create(output, pbs_run.case)
+                except Exception as e:
+                    Printer.all.err('Could not start job {:02d} of {:02d}: {}', job_id, total, e)
+                    error = error or e
+                    continue
+
+                job.full_name = "Case {}".format(pbs_run.case)
+                multijob.add(job)
+    finally:
+        pool.close()
+        pool.join()
+
+    if error is not None:
+        # jobs which were inserted will not be monitored
+        if multijob.items:
+            Printer.all.err('Following job/s were inserted into queue but will not be monitored: {}',
+                            ', '.join(str(job.id) for job in multijob.items))
+        raise error
 
     # inform that job were inserted
     Printer.console.newline()
@@ -50,8 +88,9 @@ def finish_pbs(multijob, finish_method):
     Printer.console.dyn(multijob.get_status_line())
     result = ResultHolder()
 
-    # use dynamic sleeper
-    sleeper = DynamicSleep(min=300, max=5000, steps=5)
+    # use dynamic sleeper, sleep gets longer while nothing happens
+    # so long running jobs does not generate too many qstat calls
+    sleeper = DynamicSleep(min=1000, max=30000, steps=9)
 
     # wait for finish
     while multijob.is_running():
@@ -59,6 +98,10 @@ def finish_pbs(multijob, finish_method):
         multijob.update()
         Printer.console.dyn(multijob.get_status_line())
 
+        # some job changed its status, check more often again
+        if any(job.is_active and job.status_changed for job in multijob.items):
+            sleeper.reset()
+
         # if some jobs changed status add new line to dynamic output remains
         jobs_changed = multijob.get_all(status=JobState.COMPLETED)
         if jobs_changed:
@@ -18,8 +18,15 @@ class AbstractRun(object):
         self.valgrind = False
 
     def get_command(self, args=None):
-        result = self._get_command() if not args else self._get_command() + args
-        return [str(x) for x in result]
+        """
+        Returns command list, values are not converted to str,
+        BinExecutor does that once when creating executor
+        :rtype: list
+        """
+        result = self._get_command()
+        if args:
+            result.extend(args)
+        return result
 
     def _get_mpi(self):
         return [
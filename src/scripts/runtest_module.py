@@ -2,7 +2,8 @@
 # -*- coding: utf-8 -*-
 # author:   Jan Hybs
 # ----------------------------------------------
-import time
+import os
+import stat
 import sys
 # ----------------------------------------------
 from scripts.pbs import pbs_control
@@ -102,23 +103,23 @@ class ModuleRuntest(ScriptModule):
         seq.stop_on_error = True
         return seq
 
-    def create_pbs_job_content(self, module, case):
+    def create_pbs_job_content(self, module, case, script):
         """
         Method creates pbs start script which will be passed to
         some qsub command
 
         :type case: scripts.config.yaml_config.ConfigCase
         :type module: scripts.pbs.modules.pbs_tarkil_cesnet_cz
+        :type script: str
+        :param script: path to the script which will be executed in job
         :rtype : str
         """
 
-        import pkgutil
-
         command = strings.replace_placeholders(
             runtest_command,
 
             python=sys.executable,
-            script=pkgutil.get_loader('runtest').filename,
+            script=script,
             yaml=case.file,
             limits="-n {case.proc} -m {case.memory_limit} -t {case.time_limit}".format(case=case),
             args="" if not self.arg_options.rest else Command.to_string(self.arg_options.rest),
@@ -135,16 +136,21 @@ class ModuleRuntest(ScriptModule):
         return template
 
     def prepare_pbs_files(self, pbs_module):
+        import pkgutil
+
         jobs = list()
         """ :type: list[(str, PBSModule)] """
 
+        # same script is used for every job
+        script = pkgutil.get_loader('runtest').filename
+
         for yaml_file, yaml_config in self.configs.files.items():
             for case in yaml_config.get_one(yaml_file):
                 pbs_run = pbs_module.Module(case)
                 pbs_run.queue = self.arg_options.get('queue', True)
                 pbs_run.ppn = self.arg_options.get('ppn', 1)
 
-                pbs_content = self.create_pbs_job_content(pbs_module, case)
+                pbs_content = self.create_pbs_job_content(pbs_module, case, script)
                 IO.write(case.fs.pbs_script, pbs_content)
 
                 qsub_command = pbs_run.get_pbs_command(case.fs.pbs_script)
@@ -191,8 +197,10 @@ class ModuleRuntest(ScriptModule):
 
         # run!
         runner.start()
-        while runner.is_running():
-            time.sleep(1)
+        # join with timeout returns as soon as runner ends
+        # but still allows SIGINT to be processed
+        while runner.is_alive():
+            runner.join(1)
 
         Printer.all.sep()
         Printer.all.out('Summary: ')
@@ -238,13 +246,16 @@ class ModuleRuntest(ScriptModule):
 
         self.all_yamls = list()
         for path in self.arg_options.args:
-            if not Paths.exists(path):
+            # single stat call tells both whether path exists and is a dir
+            try:
+                mode = os.stat(path).st_mode
+            except OSError:
                 Printer.all.err('given path does not exists, path "{}"', path)
                 sys.exit(3)
 
             # append files to all_yamls
-            if Paths.is_dir(path):
-                self.all_yamls.extend(Paths.walk(path, ConfigPool.yaml_filters))
+            if stat.S_ISDIR(mode):
+                self.all_yamls.extend(ConfigPool.find_yamls(path))
             else:
                 self.all_yamls.append(path)
 
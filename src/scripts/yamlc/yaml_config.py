@@ -3,6 +3,7 @@
 # author:   Jan Hybs
 # ----------------------------------------------
 import itertools
+import os
 import yaml
 
 # ----------------------------------------------
@@ -240,16 +241,45 @@ class ConfigPool(object):
     :type files : dict[str, ConfigBase]
     """
 
+    # yaml files in these dirs are ignored
+    ignore_dirs = [yamlc.TEST_RESULTS]
+
     # match only yaml files not in ref_out or test_results having config.yaml
     #  in the same directory (excluding config.yaml itself)
     yaml_filters= [
         PathFilters.filter_type_is_file(),
-        PathFilters.filter_ignore_dirs([yamlc.TEST_RESULTS, yamlc.TEST_RESULTS]),
+        PathFilters.filter_ignore_dirs(ignore_dirs),
         PathFilters.filter_not(PathFilters.filter_name('config.yaml')),
         PathFilters.filter_endswith('.yaml'),
         PathFilters.filter_dir_contains_file('config.yaml'),
     ]
 
+    @classmethod
+    def find_yamls(cls, path):
+        """
+        Returns same files as Paths.walk(path, ConfigPool.yaml_filters)
+        but all conditions are checked during single walk, file names
+        are tested first and config.yaml presence is known from the walk
+        so no extra listdir is needed for each file
+        :rtype: list[str]
+        """
+        result = list()
+        for root, dirs, files in os.walk(path):
+            if yamlc.CONFIG_YAML not in files:
+                continue
+
+            for name in files:
+                if name == yamlc.CONFIG_YAML or not name.endswith('.yaml'):
+                    continue
+
+                filename = Paths.join(root, name)
+                if [d for d in cls.ignore_dirs if filename.find(d) > 0]:
+                    continue
+
+                if Paths.is_file(filename):
+                    result.append(filename)
+        return sorted(result)
+
     def __init__(self):
         self.configs = dict()
         self.files = dict()
@@ -0,0 +1,49 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# author:   Jan Hybs
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    """
+    Class LRUCache is simple dict-like cache which holds at most maxsize items,
+    when cache is full least recently used item is removed
+    """
+
+    _missing = object()
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.items = OrderedDict()
+
+    def get(self, key, default=None):
+        """
+        Return value for given key and mark it as recently used
+        or default if key is not in cache
+        """
+        value = self.items.pop(key, self._missing)
+        if value is self._missing:
+            return default
+
+        self.items[key] = value
+        return value
+
+    def put(self, key, value):
+        """
+        Store value under given key, removes least recently used item
+        if cache is full
+        """
+        self.items.pop(key, None)
+        self.items[key] = value
+        if len(self.items) > self.maxsize:
+            self.items.popitem(last=False)
+        return value
+
+    def clear(self):
+        self.items.clear()
+
+    def __contains__(self, key):
+        return key in self.items
+
+    def __len__(self):
+        return len(self.items)
@@ -11,9 +11,11 @@ from scripts.core.base import Printer
 class ProgressCounter(object):
     """
     Class ProgressCounter is simple printer-like class which count to specific target
+    Printed line is created by callable fmt, which receives current index
+    and all arguments passed to next
     """
 
-    def __init__(self, fmt='{:02d}', printer=Printer.all):
+    def __init__(self, fmt='{:02d}'.format, printer=Printer.all):
         self.i = 0
         self.fmt = fmt
         self.printer = printer
@@ -21,11 +23,9 @@ class ProgressCounter(object):
     def reset(self):
         self.i = 0
 
-    def next(self, attributes):
+    def next(self, *args):
         self.i += 1
-        self.printer.out(self.fmt.format(
-            self.i, **attributes
-        ))
+        self.printer.out(self.fmt(self.i, *args))
 
 
 class ProgressTime(object):
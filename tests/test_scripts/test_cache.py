@@ -0,0 +1,66 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# author:   Jan Hybs
+# ----------------------------------------------
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+# ----------------------------------------------
+import test_scripts
+test_scripts.fix_paths()
+# ----------------------------------------------
+from utils.cache import LRUCache
+# ----------------------------------------------
+
+
+class TestLRUCache(test_scripts.UnitTest):
+    """
+    Class TestLRUCache tests simple LRU cache
+    """
+
+    def test_eviction_order(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.put('c', 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn('a', cache)
+        self.assertEqual(cache.get('b'), 2)
+        self.assertEqual(cache.get('c'), 3)
+
+    def test_get_refreshes(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+
+        # a is now most recently used, b is evicted
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+
+        # put of existing key refreshes it as well
+        cache.put('a', 10)
+        cache.put('d', 4)
+        self.assertEqual(cache.get('a'), 10)
+        self.assertNotIn('c', cache)
+
+    def test_put_returns_value(self):
+        cache = LRUCache()
+        value = object()
+        self.assertIs(cache.put('key', value), value)
+        self.assertIs(cache.get('key'), value)
+
+    def test_get_default(self):
+        cache = LRUCache()
+        self.assertIsNone(cache.get('missing'))
+        self.assertEqual(cache.get('missing', 'default'), 'default')
+
+        # None is valid cached value
+        cache.put('none', None)
+        self.assertIn('none', cache)
+        self.assertEqual(cache.get('none', 'default'), None)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
@@ -0,0 +1,118 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# author:   Jan Hybs
+# ----------------------------------------------
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+# ----------------------------------------------
+import test_scripts
+test_scripts.fix_paths()
+# ----------------------------------------------
+import unittest
+import xml.etree.ElementTree as PlainET
+import xml.etree.cElementTree as CElementTree
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+from ist.globals import Globals
+from ist.utils.texlist2 import TexList
+from ist.formatters import html2latex
+# ----------------------------------------------
+
+
+def tree(html):
+    return PlainET.fromstring('<html_example>' + html + '</html_example>')
+
+
+# string input is parsed with lxml when installed, cElementTree otherwise
+BACKENDS = [CElementTree]
+if lxml_etree is not None:
+    BACKENDS.append(lxml_etree)
+
+STRING_INPUTS = [
+    '',
+    'simple text',
+    '<p>para <em>it</em> tail</p><br/>x<h1>Head</h1>t',
+    '<ul><li>one</li><li><strong>two</strong> z</li></ul>after',
+    '<code>c<em>x<b>y</b></em>y</code>tail<p>q</p>',
+    '<a data-href="Alink" href="#A" text="A"><em>in</em>x</a><a href="http://x.y">t <em>e</em></a> tail',
+    'a <!-- c --> b',
+    'x<p>y<!--c-->z</p>w',
+    '<p>a</p><?pi x?>tail',
+    u'unicode \u017e <em>\u0161</em> x',
+]
+
+
+class TestHtml2Latex(test_scripts.UnitTest):
+    """
+    Class TestHtml2Latex tests conversion of html elements to latex
+    """
+
+    def tearDown(self):
+        TexList.PRETTY_FORMAT = False
+
+    def test_pretty_list_newlines(self):
+        TexList.PRETTY_FORMAT = True
+
+        # list always begins on its own line, even after newline tail
+        self.assertEqual(
+            html2latex.html_to_latex(tree('<ul><li>x</li></ul>\n<ol><li>y</li></ol>')),
+            '{\n\\begin{itemize}\n\\item {x}\n\\end{itemize}\n\n\n'
+            '\\begin{enumerate}\n\\item {y}\n\\end{enumerate}\n}'
+        )
+        self.assertEqual(
+            html2latex.html_to_latex(tree('a\n<ul><li>x</li>\n</ul>')),
+            '{a\n\n\\begin{itemize}\n\\item {x}\n\\end{itemize}\n}'
+        )
+
+    @unittest.skipIf(lxml_etree is None, 'lxml is not installed')
+    def test_lxml_comments(self):
+        # lxml keeps comments and processing instructions in tree,
+        # xml.etree drops them, result must be the same
+        for html in ('a <!-- c --> b', '<p>a</p><?pi x?>tail', 'x<p>y<!--c-->z</p>w',
+                     '<!--c-->a<em>b</em><!--c-->c<!--c-->d'):
+            lxml_tree = lxml_etree.fromstring('<html_example>' + html + '</html_example>')
+            self.assertEqual(
+                html2latex.html_to_latex(lxml_tree),
+                html2latex.html_to_latex(tree(html))
+            )
+        self.assertEqual(
+            html2latex.html_to_latex(lxml_etree.fromstring('<html_example>a <!-- c --> b</html_example>')),
+            '{a  b}'
+        )
+
+    def test_string_input(self):
+        # string input is parsed by either backend, result must match tree conversion
+        default = html2latex.ET
+        try:
+            for backend in BACKENDS:
+                html2latex.ET = backend
+                for html in STRING_INPUTS:
+                    self.assertEqual(
+                        html2latex.html_to_latex(html),
+                        html2latex.html_to_latex(tree(html.encode('utf-8'))),
+                        '{} ({})'.format(repr(html), backend.__name__)
+                    )
+        finally:
+            html2latex.ET = default
+
+        self.assertEqual(html2latex.html_to_latex('x<p>y<!--c-->z</p>w'), '{x{{yz}{w}}}')
+
+    def test_description_cache(self):
+        # same description is converted only once
+        TexList.description_cache.clear()
+        TexList.description('some *text*')
+        TexList.description('some *text*')
+        self.assertEqual(len(TexList.description_cache), 1)
+
+        # links depend on registered items, registering
+        # item invalidates converted descriptions
+        key = Globals.save('test_description_cache', object())
+        try:
+            TexList.description('some *text*')
+            self.assertEqual(len(TexList.description_cache), 2)
+        finally:
+            del Globals.items[key]
+            TexList.description_cache.clear()
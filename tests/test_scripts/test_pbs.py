@@ -5,6 +5,7 @@
 import os
 import sys
 import shutil
+import subprocess
 # ----------------------------------------------
 sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
 # ----------------------------------------------
@@ -14,6 +15,7 @@ test_scripts.fix_paths()
 import utils.argparser as argparser
 from scripts.core.threads import ResultHolder
 from scripts.pbs.modules.local_pbs import Module
+from scripts.pbs.pbs_control import insert_jobs
 # ----------------------------------------------
 
 
@@ -93,4 +95,59 @@ class TestDoWork(test_scripts.UnitTest):
             fp.write('delete me')
 
         result = exec_call('-n', '2', '-q', '--', 'mpirun', 'rm', dummy_file)
-        self.assertNotEqual(result.returncode, EXIT_OK)
\ No newline at end of file
+        self.assertNotEqual(result.returncode, EXIT_OK)
+
+
+class DummyPBSModule(object):
+    """
+    Class DummyPBSModule creates jobs from output of qsub command
+    """
+
+    class ModuleJob(object):
+        created = list()
+
+        def __init__(self, job_id, case):
+            self.id = job_id
+            self.case = case
+
+        @classmethod
+        def create(cls, output, case):
+            job = cls(output.strip(), case)
+            cls.created.append(job)
+            return job
+
+
+class DummyRun(object):
+    def __init__(self, case):
+        self.case = case
+
+
+class TestInsertJobs(test_scripts.UnitTest):
+    """
+    Class TestInsertJobs tests submitting of jobs into queue
+    """
+
+    def test_failed_qsub(self):
+        """
+        All qsub commands are processed even if some of them fail,
+        so no job is submitted and forgotten, first error is raised
+        """
+        del DummyPBSModule.ModuleJob.created[:]
+        jobs = [
+            (['echo', '1'], DummyRun('a')),
+            (['false'], DummyRun('b')),
+            (['echo', '3'], DummyRun('c')),
+            (['echo', '4'], DummyRun('d')),
+        ]
+        with self.assertRaises(subprocess.CalledProcessError):
+            insert_jobs(jobs, DummyPBSModule, workers=2)
+        self.assertEqual(
+            [job.id for job in DummyPBSModule.ModuleJob.created],
+            ['1', '3', '4'])
+
+    def test_insert_jobs(self):
+        del DummyPBSModule.ModuleJob.created[:]
+        jobs = [(['echo', str(i)], DummyRun(i)) for i in range(5)]
+        multijob = insert_jobs(jobs, DummyPBSModule, workers=2)
+        self.assertEqual([job.id for job in multijob.items], ['0', '1', '2', '3', '4'])
+        self.assertEqual([job.case for job in multijob.items], range(5))
@@ -0,0 +1,149 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# author:   Jan Hybs
+# ----------------------------------------------
+import os
+import sys
+import threading
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+# ----------------------------------------------
+import test_scripts
+test_scripts.fix_paths()
+# ----------------------------------------------
+from scripts.core.threads import ExtendedThread, ParallelThreads, ProcessState
+# ----------------------------------------------
+
+
+class DummyThread(ExtendedThread):
+    """
+    Class DummyThread runs given target and ends with given returncode
+    """
+
+    def __init__(self, name, target=None, returncode=0):
+        super(DummyThread, self).__init__(name, target)
+        self.rc = returncode
+
+    def _run(self):
+        if self.target:
+            self.target()
+        self.returncode = self.rc
+
+
+def run_parallel(threads, n):
+    runner = ParallelThreads(n)
+    for thread in threads:
+        runner.add(thread)
+    # runner must not hang, join with timeout and do not
+    # block interpreter exit if it does
+    runner.daemon = True
+    runner.start()
+    runner.join(10)
+    return runner
+
+
+class TestParallelThreads(test_scripts.UnitTest):
+    """
+    Class TestParallelThreads tests scheduling of ParallelThreads
+    """
+
+    def test_slot_refill(self):
+        """
+        Free slot is used as soon as some thread completes,
+        slow thread can be still running
+        """
+        last_started = threading.Event()
+        result = dict()
+
+        def slow():
+            result['refilled'] = last_started.wait(5)
+
+        threads = [
+            DummyThread('slow', slow),
+            DummyThread('fast1'),
+            DummyThread('fast2'),
+            DummyThread('last', last_started.set),
+        ]
+        runner = run_parallel(threads, 2)
+
+        self.assertFalse(runner.is_alive())
+        self.assertTrue(result['refilled'])
+        self.assertEqual(runner.returncode, 0)
+        self.assertTrue(all(thread.is_over() for thread in threads))
+
+    def test_stop_on_error(self):
+        """
+        No other thread is started once some thread fails
+        """
+        threads = [
+            DummyThread('ok'),
+            DummyThread('error', returncode=1),
+            DummyThread('next'),
+            DummyThread('other'),
+        ]
+        runner = run_parallel(threads, 1)
+
+        self.assertFalse(runner.is_alive())
+        self.assertEqual(runner.returncode, 1)
+        self.assertTrue(runner.stopped)
+        self.assertEqual(
+            [thread.state for thread in threads],
+            [ProcessState.FINISHED, ProcessState.FINISHED, ProcessState.NOT_STARTED, ProcessState.NOT_STARTED])
+
+    def test_thread_exception(self):
+        """
+        Thread which raises exception still completes and runner does not hang
+        """
+        def broken():
+            raise Exception('broken thread')
+
+        threads = [
+            DummyThread('broken', broken),
+            DummyThread('ok'),
+        ]
+        runner = run_parallel(threads, 1)
+
+        self.assertFalse(runner.is_alive())
+        self.assertTrue(all(thread.is_over() for thread in threads))
+        self.assertIsNone(threads[0].returncode)
+
+    def test_start_handler_exception(self):
+        """
+        Thread which on_start handler raises exception does not hang the runner
+        """
+        def broken(thread):
+            raise Exception('broken on_start handler')
+
+        threads = [
+            DummyThread('broken'),
+            DummyThread('ok'),
+        ]
+        threads[0].on_start += broken
+        runner = run_parallel(threads, 2)
+
+        self.assertFalse(runner.is_alive())
+        self.assertTrue(all(thread.is_over() for thread in threads))
+        self.assertEqual(runner.completed, 2)
+
+    def test_complete_handler_exception(self):
+        """
+        Runner is notified even if on_complete handler with higher priority raises
+        """
+        def broken(thread):
+            raise Exception('broken on_complete handler')
+
+        threads = [
+            DummyThread('broken'),
+            DummyThread('ok'),
+        ]
+        threads[0].on_complete += (broken, 10)
+        runner = run_parallel(threads, 2)
+
+        self.assertFalse(runner.is_alive())
+        self.assertTrue(all(thread.is_over() for thread in threads))
+        self.assertEqual(runner.completed, 2)
+
+    def test_add_without_events(self):
+        runner = ParallelThreads(2)
+        with self.assertRaises(AttributeError):
+            runner.add(object())
+        self.assertEqual(runner.total, 0)
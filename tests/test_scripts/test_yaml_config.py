@@ -0,0 +1,60 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# author:   Jan Hybs
+# ----------------------------------------------
+import os
+import sys
+import shutil
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+# ----------------------------------------------
+import test_scripts
+test_scripts.fix_paths()
+# ----------------------------------------------
+from scripts.core.base import Paths
+from scripts.yamlc.yaml_config import ConfigPool
+# ----------------------------------------------
+
+
+class TestConfigPool(test_scripts.UnitTest):
+    """
+    Class TestConfigPool tests lookup of yaml files
+    """
+
+    files = [
+        'a/config.yaml',
+        'a/case1.yaml',
+        'a/case2.yaml',
+        'a/notes.txt',
+        'a/test_results/config.yaml',
+        'a/test_results/output.yaml',
+        'a/nested/config.yaml',
+        'a/nested/deep.yaml',
+        'b/case.yaml',
+        'b/other.txt',
+    ]
+    dirs = [
+        'a/dir.yaml',
+        'c',
+    ]
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        for d in self.dirs:
+            os.makedirs(os.path.join(self.root, d))
+        for f in self.files:
+            Paths.ensure_path(os.path.join(self.root, f))
+            with open(os.path.join(self.root, f), 'w') as fp:
+                fp.write('')
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_find_yamls(self):
+        result = ConfigPool.find_yamls(self.root)
+        self.assertEqual(result, Paths.walk(self.root, ConfigPool.yaml_filters))
+        self.assertEqual(result, [
+            os.path.join(self.root, 'a', 'case1.yaml'),
+            os.path.join(self.root, 'a', 'case2.yaml'),
+            os.path.join(self.root, 'a', 'nested', 'deep.yaml'),
+        ])